@@ -5,6 +5,8 @@ Handles API keys and settings for real data integration
 
 import os
 import sys
+from functools import lru_cache
+from typing import Optional
 from openai import AzureOpenAI, OpenAI
 
 # Import constants instead of using dotenv
@@ -47,7 +49,10 @@ class Config:
     OPENAI_MODEL = getattr(constants, 'OPENAI_MODEL', "gpt-4o-mini") if constants else "gpt-4o-mini"
     DATE_EXTRACTION_MODEL = getattr(constants, 'DATE_EXTRACTION_MODEL', "gpt-3.5-turbo") if constants else "gpt-3.5-turbo"
     MAX_TOKENS = getattr(constants, 'MAX_TOKENS', 1000) if constants else 1000
+    CURATION_BATCH_SIZE = getattr(constants, 'CURATION_BATCH_SIZE', 20) if constants else 20
     TEMPERATURE = getattr(constants, 'TEMPERATURE', 0.0) if constants else 0.0
+    # Directory for the persistent curation cache (needs diskcache); None keeps curations in memory only
+    CURATION_CACHE_DIR = getattr(constants, 'CURATION_CACHE_DIR', None) if constants else None
     
     # API rate limits and timeouts
     REQUEST_TIMEOUT = 30
@@ -126,11 +131,28 @@ class Config:
             else:
                 return cls.OPENAI_MODEL
 
+@lru_cache(maxsize=None)
+def _shared_openai_client(client_type: str, api_key: str, azure_endpoint: Optional[str],
+                          api_version: Optional[str], max_retries: int):
+    """One client per set of credentials, so every agent shares its pool of keep-alive connections"""
+    if client_type == 'azure':
+        print("Using Azure OpenAI client")
+        return AzureOpenAI(
+            api_key=api_key,
+            azure_endpoint=azure_endpoint,
+            api_version=api_version,
+            max_retries=max_retries  # rate-limit/5xx/connection errors retried with exponential backoff
+        )
+    else:
+        print("Using direct OpenAI client")
+        return OpenAI(api_key=api_key, max_retries=max_retries)
+
 def create_openai_client(config: 'Config'):
     """
     Create appropriate OpenAI client based on configuration.
     Returns Azure OpenAI client if Azure credentials are available,
-    otherwise returns direct OpenAI client.
+    otherwise returns direct OpenAI client. Agents configured with the
+    same credentials get the same (thread-safe) client instance.
     
     Args:
         config: Config instance with API credentials
@@ -146,13 +168,6 @@ def create_openai_client(config: 'Config'):
     if not client_config:
         raise ValueError("No valid OpenAI credentials found. Please configure either OPENAI_API_KEY or Azure OpenAI credentials.")
     
-    if client_config['type'] == 'azure':
-        print("Using Azure OpenAI client")
-        return AzureOpenAI(
-            api_key=client_config['api_key'],
-            azure_endpoint=client_config['azure_endpoint'],
-            api_version=client_config['api_version']
-        )
-    else:
-        print("Using direct OpenAI client")
-        return OpenAI(api_key=client_config['api_key'])
+    return _shared_openai_client(client_config['type'], client_config['api_key'],
+                                 client_config.get('azure_endpoint'), client_config.get('api_version'),
+                                 config.MAX_RETRIES)
@@ -21,13 +21,39 @@ from alert_metadata_tracker import (
     get_tracker
 )
 
+# orjson is an optional C JSON codec for the LLM's JSON replies
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Regex date patterns used by DateExtractionAgent, compiled once at import
+_REGEX_DATE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), date_format) for pattern, date_format in [
+    # URL-specific patterns (e.g., /2024/03/15/ or /20240315/)
+    (r'/(\d{4})/(\d{1,2})/(\d{1,2})/', '%Y-%m-%d'),
+    (r'/(\d{8})/', '%Y%m%d'),  # /20240315/
+    # Standard date formats
+    (r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})', '%Y-%m-%d'),
+    (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', '%B %d %Y'),
+    (r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.?\s+(\d{1,2}),?\s+(\d{4})', '%b %d %Y'),
+    (r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})', '%d %B %Y'),
+    (r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.?\s+(\d{4})', '%d %b %Y'),
+    (r'(?:Published|Date|Posted|Released):\s*(\d{4})[-/](\d{1,2})[-/](\d{1,2})', '%Y-%m-%d'),
+])
+
+# JSON payload inside a markdown-fenced LLM reply, and the bare-object fallback
+_FENCED_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+@dataclass(slots=True)
 class ArticleData:
-    """Structured article data"""
+    """Structured article data (slotted: no per-instance __dict__, faster field access)"""
     title: str
     content: str
     url: str
@@ -68,24 +94,24 @@ class DateExtractionAgent:
             try:
                 parsed_date = self._parse_date_string(raw_date)
                 if parsed_date and self._is_valid_date(parsed_date):
-                    logger.debug(f"✅ Found valid date in metadata: {parsed_date.date()}")
+                    logger.debug("✅ Found valid date in metadata: %s", parsed_date.date())
                     return parsed_date
             except Exception as e:
-                logger.debug(f"Failed to parse metadata date: {e}")
+                logger.debug("Failed to parse metadata date: %s", e)
         
         # Strategy 2: Extract from content using LLM with full context (URL, content, metadata)
         extracted_date = self._llm_extract_date(title, content, url, metadata)
         if extracted_date and self._is_valid_date(extracted_date):
-            logger.debug(f"✅ LLM extracted date: {extracted_date.date()}")
+            logger.debug("✅ LLM extracted date: %s", extracted_date.date())
             return extracted_date
             
         # Strategy 3: Regex patterns as fallback (including URL patterns)
         extracted_date = self._regex_extract_date(title, content, url)
         if extracted_date and self._is_valid_date(extracted_date):
-            logger.debug(f"✅ Regex extracted date: {extracted_date.date()}")
+            logger.debug("✅ Regex extracted date: %s", extracted_date.date())
             return extracted_date
             
-        logger.debug(f"❌ No valid date found for: {title[:50]}...")
+        logger.debug("❌ No valid date found for: %.50s...", title)
         return None
     
     def _parse_date_string(self, date_str: str) -> Optional[datetime]:
@@ -176,7 +202,7 @@ Return ONLY the date or "none"."""
                     return extracted_date
                 
         except Exception as e:
-            logger.debug(f"LLM date extraction failed: {e}")
+            logger.debug("LLM date extraction failed: %s", e)
             
         return None
     
@@ -185,24 +211,10 @@ Return ONLY the date or "none"."""
         # Include URL in the search text - dates are often in URL paths
         text_to_search = (url + " " + title + " " + content)[:2000]
         
-        date_patterns = [
-            # URL-specific patterns (e.g., /2024/03/15/ or /20240315/)
-            (r'/(\d{4})/(\d{1,2})/(\d{1,2})/', '%Y-%m-%d'),
-            (r'/(\d{8})/', '%Y%m%d'),  # /20240315/
-            # Standard date formats
-            (r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})', '%Y-%m-%d'),
-            (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', '%B %d %Y'),
-            (r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.?\s+(\d{1,2}),?\s+(\d{4})', '%b %d %Y'),
-            (r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})', '%d %B %Y'),
-            (r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)\.?\s+(\d{4})', '%d %b %Y'),
-            (r'(?:Published|Date|Posted|Released):\s*(\d{4})[-/](\d{1,2})[-/](\d{1,2})', '%Y-%m-%d'),
-        ]
-        
         extracted_dates = []
         
-        for pattern, date_format in date_patterns:
-            matches = re.finditer(pattern, text_to_search, re.IGNORECASE)
-            for match in matches:
+        for pattern, date_format in _REGEX_DATE_PATTERNS:
+            for match in pattern.finditer(text_to_search):
                 try:
                     if '%B' in date_format or '%b' in date_format:
                         date_str = ' '.join(match.groups())
@@ -210,7 +222,7 @@ Return ONLY the date or "none"."""
                         # Handle /20240315/ format
                         date_str = match.group(1)
                     else:
-                        if pattern.startswith(r'(\d{4})') or pattern.startswith(r'/(\d{4})'):
+                        if pattern.pattern.startswith(r'(\d{4})') or pattern.pattern.startswith(r'/(\d{4})'):
                             # Handle YYYY-MM-DD or /YYYY/MM/DD/ formats
                             groups = match.groups()
                             if len(groups) >= 3:
@@ -329,18 +341,17 @@ Return ONLY the JSON object, nothing else."""
             # Remove markdown code blocks if present
             if response_text.startswith('```'):
                 # Extract JSON from markdown code block
-                import re
-                json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
+                json_match = _FENCED_JSON_RE.search(response_text)
                 if json_match:
                     response_text = json_match.group(1)
                 else:
                     # Try to find JSON object
-                    json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+                    json_match = _JSON_OBJECT_RE.search(response_text)
                     if json_match:
                         response_text = json_match.group(0)
             
-            # Parse JSON response
-            analysis = json.loads(response_text)
+            # Parse JSON response (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            analysis = orjson.loads(response_text) if ORJSON_AVAILABLE else json.loads(response_text)
             
             # Validate and clean the analysis
             analysis['relevance_score'] = max(0, min(100, analysis.get('relevance_score', 0)))
@@ -585,6 +596,9 @@ class MultiAgentPharmaAgent:
         logger.info(f"Date Range: {start_date.date()} to {end_date.date()}")
         logger.info(f"Search Type: {search_type}")
         
+        # Capture the wall clock once per run; collectors reuse it as their date fallback
+        now = datetime.now()
+        
         workflow_results = {
             'success': False,
             'results': [],
@@ -593,7 +607,7 @@ class MultiAgentPharmaAgent:
                 'start_date': start_date.isoformat(),
                 'end_date': end_date.isoformat(),
                 'search_type': search_type,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
                 'workflow_stats': {}
             }
         }
@@ -636,7 +650,7 @@ class MultiAgentPharmaAgent:
             print(f"   - Keywords: {keywords}")
             print(f"   - Sources: {search_engines}")
             raw_data = self.data_collector._collect_multi_source_data(
-                keywords, start_date, end_date, search_engines
+                keywords, start_date, end_date, search_engines, fallback_dt=now
             )
             
             # Flatten all articles into a single list
@@ -704,7 +718,7 @@ class MultiAgentPharmaAgent:
             for article in articles:
                 if not article.extracted_date:
                     date_filter_stats["no_date"] += 1
-                    logger.debug(f"❌ Discarding article (no date after LLM extraction): {article.title[:60]}...")
+                    logger.debug("❌ Discarding article (no date after LLM extraction): %.60s...", article.title)
                     continue
                     
                 if start_date <= article.extracted_date <= end_date:
@@ -716,7 +730,7 @@ class MultiAgentPharmaAgent:
                         logger.info(f"✅ LLM rescued article with extracted date: {article.title[:60]}...")
                 else:
                     date_filter_stats["out_of_range"] += 1
-                    logger.debug(f"📅 Article date {article.extracted_date.date()} outside range: {article.title[:60]}...")
+                    logger.debug("📅 Article date %s outside range: %.60s...", article.extracted_date.date(), article.title)
             
             workflow_results['metadata']['workflow_stats']['date_filtering'] = date_filter_stats
             logger.info(f"✅ Date filtering complete: {date_filter_stats}")
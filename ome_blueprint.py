@@ -16,11 +16,24 @@ import csv
 import io
 import os
 import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import List, Dict, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from flask import Blueprint, render_template_string, request, jsonify, send_file
+from flask import Blueprint, render_template_string, request, jsonify, send_file, current_app
+
+# orjson is an optional C JSON codec for the large result payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # Import our agentic workflow
 try:
@@ -56,6 +69,29 @@ if not AGENT_AVAILABLE:
 # Create Blueprint instead of Flask app
 ome_blueprint = Blueprint('ome', __name__)
 
+# Shared keep-alive session for the blueprint's direct API calls, so requests reuse pooled connections
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=20, pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+))
+
+def json_response(payload: Dict[str, Any]):
+    """
+    jsonify for result payloads, encoded with orjson when it is installed.
+    Dates and any other values orjson does not encode itself go through Flask's JSON default,
+    so the response body decodes to the same data either way.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            body = orjson.dumps(payload, default=current_app.json.default,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+        else:
+            return current_app.response_class(body, mimetype='application/json')
+    return jsonify(payload)
+
 # Initialize Pharma News Agent (if available)
 pharma_agent = None
 if AGENT_AVAILABLE:
@@ -485,7 +521,7 @@ def search_pubmed(keywords: List[str], max_results: int = 20, start_date: dateti
             'sort': 'relevance'
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = http_session.get(url, params=params, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -502,21 +538,20 @@ def search_pubmed(keywords: List[str], max_results: int = 20, start_date: dateti
             'retmode': 'xml'
         }
         
-        response = requests.get(url, params=params, timeout=30)
+        response = http_session.get(url, params=params, timeout=30)
         response.raise_for_status()
         
-        # Parse XML (simplified)
+        # Parse XML (simplified), straight from the response bytes and one record at a time so
+        # each title/abstract stays paired with its own PMID
         results = []
-        xml_content = response.text
-        
-        # Extract titles
-        titles = re.findall(r'<ArticleTitle>(.*?)</ArticleTitle>', xml_content)
-        abstracts = re.findall(r'<AbstractText.*?>(.*?)</AbstractText>', xml_content)
-        pmids_found = re.findall(r'<PMID.*?>(.*?)</PMID>', xml_content)
-        
-        for i, pmid in enumerate(pmids_found[:max_results]):
-            title = titles[i] if i < len(titles) else "No title"
-            abstract = abstracts[i] if i < len(abstracts) else "No abstract"
+        root = ET.fromstring(response.content)
+        
+        for article in islice(root.iterfind('PubmedArticle'), max_results):
+            pmid = article.findtext('.//PMID')
+            title_elem = article.find('.//ArticleTitle')
+            abstract_elem = article.find('.//AbstractText')
+            title = ''.join(title_elem.itertext()) if title_elem is not None else "No title"
+            abstract = ''.join(abstract_elem.itertext()) if abstract_elem is not None else "No abstract"
             
             result = {
                 'title': title,
@@ -544,18 +579,21 @@ def search_all_sources(keywords: List[str], max_results: int = 50, start_date: d
     
     # Search each source
     sources = [
-        lambda: search_pubmed(keywords, max_results // 2, start_date, end_date),
-        lambda: search_newsapi(keywords, max_results // 2)
+        ('PubMed', lambda: search_pubmed(keywords, max_results // 2, start_date, end_date)),
+        ('NewsAPI', lambda: search_newsapi(keywords, max_results // 2))
     ]
     
-    for search_func in sources:
-        try:
-            results = search_func()
-            all_results.extend(results)
-            print(f"Found {len(results)} results from {search_func.__name__}")
-        except Exception as e:
-            print(f"Error in {search_func.__name__}: {str(e)}")
-            continue
+    # Sources are independent network calls: run them concurrently and merge in source order
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = [(name, executor.submit(search_func)) for name, search_func in sources]
+        for name, future in futures:
+            try:
+                results = future.result()
+                all_results.extend(results)
+                print(f"Found {len(results)} results from {name}")
+            except Exception as e:
+                print(f"Error in {name}: {str(e)}")
+                continue
     
     # Remove duplicates based on URL
     seen_urls = set()
@@ -3372,7 +3410,7 @@ def search():
         if AGENT_AVAILABLE and pharma_agent and workflow_result:
             workflow_stats = workflow_result.get('metadata', {}).get('workflow_stats', {})
         
-        return jsonify({
+        return json_response({
             'success': True,
             'results': processed_results,
             'results_by_source': results_by_source,
@@ -3569,7 +3607,7 @@ def process_user_alerts_route():
                 'timestamp': datetime.now()
             }
             
-            return jsonify({
+            return json_response({
                 'success': True,
                 'session_id': session_id,
                 'user': selected_user,
@@ -4201,7 +4239,7 @@ def get_result_by_hash_route(hash_id):
         if not result:
             return jsonify({'error': 'Result not found'}), 404
         
-        return jsonify({
+        return json_response({
             'success': True,
             'result': result
         })
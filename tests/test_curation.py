@@ -0,0 +1,98 @@
+"""
+Curation replies are mapped to articles by the id each analysis echoes; only matched analyses are cached
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import pharma_agent
+from pharma_agent import PharmaNewsAgent
+
+_ARTICLE_TITLE_RE = re.compile(r'^(\d+)\. Title: (.*)$', re.MULTILINE)
+
+
+class FakeCompletions:
+    """Answers each curation prompt through reply(numbered_titles), recording the titles of every prompt"""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+
+    def create(self, model, messages, **kwargs):
+        numbered_titles = [(int(number), title) for number, title in _ARTICLE_TITLE_RE.findall(messages[0]['content'])]
+        self.prompts.append([title for _, title in numbered_titles])
+        content = self.reply(numbered_titles)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _analysis(number, title):
+    return {'id': number, 'relevance_score': 90, 'summary': f'about {title}'}
+
+
+@pytest.fixture
+def agent():
+    pharma_agent._CURATION_CACHE.clear()
+    agent = PharmaNewsAgent()
+    agent.config.CURATION_BATCH_SIZE = 4
+    yield agent
+    pharma_agent._CURATION_CACHE.clear()
+
+
+def _curate(agent, reply, count=4):
+    agent.openai_client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(reply)))
+    articles = [{'title': f'Oncology drug {i}', 'content': 'oncology trial results', 'url': f'https://example.com/{i}',
+                 'source_name': 'Example'} for i in range(count)]
+    curated, stats = agent._intelligent_curation(articles, ['oncology'])
+    return agent.openai_client.chat.completions, curated, stats
+
+
+def test_reordered_reply_is_mapped_by_id(agent):
+    completions, curated, stats = _curate(agent, lambda numbered: json.dumps(
+        {'items': [_analysis(number, title) for number, title in reversed(numbered)]}
+    ))
+
+    assert [article['ai_summary'] for article in curated] == [f'about Oncology drug {i}' for i in range(4)]
+    assert stats['articles_curated'] == 4
+    assert len(completions.prompts) == 1
+
+    _, _, cached_stats = _curate(agent, lambda numbered: pytest.fail('cached articles were sent again'))
+    assert cached_stats['curation_cache_hits'] == 4
+
+
+def test_short_reply_is_not_cached_for_missing_articles(agent):
+    completions, curated, stats = _curate(agent, lambda numbered: json.dumps(
+        {'items': [_analysis(number, title) for number, title in numbered if title != 'Oncology drug 2']}
+    ))
+
+    assert completions.prompts[1:] == [['Oncology drug 2']]
+    assert [article['ai_relevance_score'] for article in curated] == [90, 90, 50, 90]
+    assert stats['articles_curated'] == 3
+
+    completions, _, stats = _curate(agent, lambda numbered: json.dumps(
+        {'items': [_analysis(number, title) for number, title in numbered]}
+    ))
+    assert completions.prompts == [['Oncology drug 2']]
+    assert stats['curation_cache_hits'] == 3
+
+
+def test_analysis_with_unknown_id_is_ignored(agent):
+    _, curated, stats = _curate(agent, lambda numbered: json.dumps(
+        {'items': [_analysis(number + 10, title) for number, title in numbered]}
+    ), count=1)
+
+    assert curated[0]['ai_relevance_score'] == 50
+    assert stats['articles_curated'] == 0
+    _, _, stats = _curate(agent, lambda numbered: json.dumps({'items': []}), count=1)
+    assert stats['curation_cache_hits'] == 0
+
+
+@pytest.mark.parametrize('reply', [{'analyses': []}, {'items': {'id': 1}}, 'not json'])
+def test_reply_without_items_list_is_retried_then_failed(agent, reply):
+    completions, curated, stats = _curate(agent, lambda numbered: reply if isinstance(reply, str) else json.dumps(reply))
+
+    assert sorted(map(len, completions.prompts)) == [2, 2, 4]
+    assert stats['articles_curated'] == 0
+    assert not any(article.get('ai_summary', '').startswith('about') for article in curated)
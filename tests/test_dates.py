@@ -0,0 +1,41 @@
+"""
+Date helpers with optional accelerators agree with their pure-Python paths
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import pharma_agent
+from pharma_agent import _dates_in_range_mask
+
+
+def test_dates_in_range_mask_matches_pure_python(monkeypatch):
+    pytest.importorskip('numpy')
+    start_date, end_date = datetime(2025, 6, 1), datetime(2025, 6, 30, 23, 59, 59)
+    dates = [
+        start_date, end_date, start_date - timedelta(microseconds=1), end_date + timedelta(microseconds=1),
+        datetime(2025, 6, 15, 12, 30), datetime(2024, 6, 15), datetime(2026, 1, 1), datetime(1970, 1, 1),
+    ]
+    vectorized = _dates_in_range_mask(dates, start_date, end_date)
+
+    monkeypatch.setattr(pharma_agent, 'NUMPY_AVAILABLE', False)
+    assert vectorized == _dates_in_range_mask(dates, start_date, end_date)
+    assert vectorized == [True, True, False, False, True, False, False, False]
+    assert _dates_in_range_mask([], start_date, end_date) == []
+
+
+def test_hyperscan_date_matches_equal_re(monkeypatch):
+    pytest.importorskip('hyperscan')
+    assert pharma_agent._DATE_PATTERNS_DB is not None
+    text = (
+        "Published: 2024-01-15. Trial began on 12 March 2024 and ended Mar. 15, 2024; "
+        "see 2024/01/2024/02/03, 22024-11-12 and 2024-11-123. Updated January\xa031,\xa02024 "
+        "and ١٢ March ٢٠٢٤ (Sept 5, 2024). No date here: 12345."
+    )
+    texts = [text, text.lower(), "no dates at all", ""]
+    accelerated = [list(pharma_agent._iter_date_matches(sample)) for sample in texts]
+
+    monkeypatch.setattr(pharma_agent, '_DATE_PATTERNS_DB', None)
+    assert accelerated == [list(pharma_agent._iter_date_matches(sample)) for sample in texts]
+    assert accelerated[0]
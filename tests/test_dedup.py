@@ -0,0 +1,84 @@
+"""
+Cross-source deduplication: which copy of an article survives
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import pharma_agent
+from pharma_agent import PharmaNewsAgent, _canonical_article_key, _canonical_url
+
+
+def _article(source, raw_score, url='https://www.example.com/study/?utm_source=feed'):
+    return {'title': 'Rare term study', 'content': 'Results for the rare term', 'url': url,
+            'date': '2025-06-28', 'source': source, 'raw_score': raw_score, 'date_found': True}
+
+
+@pytest.mark.parametrize('url, canonical', [
+    ('http://www.Example.com/Study/', 'https://example.com/Study'),
+    ('https://example.com/study?utm_source=feed&utm_medium=rss', 'https://example.com/study'),
+    ('https://example.com/study?id=7&fbclid=abc&gclid=def#results', 'https://example.com/study?id=7'),
+    ('https://example.com/study?page=2&ref=home', 'https://example.com/study?page=2'),
+    ('  https://example.com/  ', 'https://example.com'),
+    ('', ''),
+    (None, ''),
+])
+def test_canonical_url(url, canonical):
+    assert _canonical_url(url) == canonical
+
+
+def test_canonical_article_key_uses_canonical_url_and_title_prefix():
+    title = 'A' * 100
+    key = _canonical_article_key({'url': 'http://www.example.com/study/?utm_campaign=x', 'title': title})
+
+    assert key == ('https://example.com/study', 'a' * 80)
+    assert key == _canonical_article_key({'url': 'https://example.com/study', 'title': title.lower() + ' more'})
+    assert key != _canonical_article_key({'url': 'https://example.com/study?page=2', 'title': title})
+    assert _canonical_article_key({}) == ('', '')
+
+
+@pytest.fixture
+def agent():
+    pharma_agent._SEARCH_CACHE.clear()
+    agent = PharmaNewsAgent()
+    agent.api_status = {**agent.api_status, 'exa_configured': True, 'openai_configured': False}
+    yield agent
+    pharma_agent._SEARCH_CACHE.clear()
+
+
+@pytest.mark.parametrize('pubmed_delay, exa_delay', [(0.0, 0.2), (0.2, 0.0)])
+def test_pipeline_keeps_preferred_copy_whatever_answers_first(agent, monkeypatch, pubmed_delay, exa_delay):
+    def searcher(source, raw_score, delay, url):
+        def search(keywords, start_date, end_date, fallback_dt=None):
+            time.sleep(delay)
+            return [_article(source, raw_score, url)]
+        return search
+
+    monkeypatch.setattr(agent, '_get_source_searchers', lambda: {
+        'pubmed': searcher('pubmed', 0.4, pubmed_delay, 'https://www.example.com/study/?utm_source=feed'),
+        'exa': searcher('exa', 0.9, exa_delay, 'http://example.com/study'),
+    })
+    end_date = datetime(2025, 6, 30)
+    pipeline = asyncio.run(agent._run_research_pipeline(
+        ['rare term'], end_date - timedelta(days=7), end_date, 'standard', ['pubmed', 'exa'], end_date
+    ))
+
+    assert [article['source'] for article in pipeline['scored_data']] == ['exa']
+    assert sorted(pipeline['scored_data'][0]['sources']) == ['exa', 'pubmed']
+    assert pipeline['duplicates_removed'] == 1
+
+
+def test_collection_dedup_uses_canonical_url(agent):
+    raw_data = {
+        'pubmed': [_article('pubmed', 0.4, 'http://www.Example.com/study/?utm_source=feed#top')],
+        'exa': [_article('exa', 0.9, 'https://example.com/study'),
+                _article('exa', 0.9, 'https://example.com/study?page=2')],
+    }
+    deduped, duplicates_removed = agent._dedupe_articles(raw_data)
+
+    assert duplicates_removed == 1
+    assert [article['url'] for article in deduped['exa']] == ['https://example.com/study?page=2']
+    assert deduped['pubmed'][0]['sources'] == ['pubmed', 'exa']
@@ -0,0 +1,114 @@
+"""
+Failed source searches: reported as errors, never cached, and not retried with expanded terms;
+partial failures are only warnings
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import pharma_agent
+from pharma_agent import PharmaNewsAgent, _SourceSearchError
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """Agent searching PubMed (answers, finds nothing) and Exa (down), recording each searcher call"""
+    pharma_agent._SEARCH_CACHE.clear()
+    agent = PharmaNewsAgent()
+    agent.api_status = {**agent.api_status, 'exa_configured': True, 'openai_configured': False}
+    agent.calls = []
+
+    def pubmed(keywords, start_date, end_date, fallback_dt=None):
+        agent.calls.append(('pubmed', tuple(keywords)))
+        return []
+
+    def exa(keywords, start_date, end_date, fallback_dt=None):
+        agent.calls.append(('exa', tuple(keywords)))
+        raise _SourceSearchError("Exa API error: 503")
+
+    monkeypatch.setattr(agent, '_get_source_searchers', lambda: {'pubmed': pubmed, 'exa': exa})
+    yield agent
+    pharma_agent._SEARCH_CACHE.clear()
+
+
+def _date_range():
+    end_date = datetime(2025, 6, 30)
+    return end_date - timedelta(days=7), end_date
+
+
+def test_failed_source_is_not_retried_with_expanded_terms(agent):
+    start_date, end_date = _date_range()
+    raw_data = agent._collect_multi_source_data(['rare term'], start_date, end_date, ['pubmed', 'exa'])
+
+    assert [source for source, _ in agent.calls].count('exa') == 1
+    assert [source for source, _ in agent.calls].count('pubmed') == 2
+    assert raw_data['exa'] == []
+    assert raw_data['fallback']
+
+
+def test_pipeline_does_not_retry_failed_source(agent):
+    start_date, end_date = _date_range()
+    pipeline = asyncio.run(agent._run_research_pipeline(
+        ['rare term'], start_date, end_date, 'standard', ['pubmed', 'exa'], end_date
+    ))
+
+    assert [source for source, _ in agent.calls].count('exa') == 1
+    assert [source for source, _ in agent.calls].count('pubmed') == 2
+    assert pipeline['raw_data']['fallback']
+
+
+def test_failed_search_is_not_cached(agent):
+    start_date, end_date = _date_range()
+    _, articles, error, failed = agent._search_source('exa', ['rare term'], start_date, end_date)
+    _, _, error_again, _ = agent._search_source('exa', ['rare term'], start_date, end_date)
+
+    assert articles == [] and failed
+    assert error == error_again == "Exa API error: 503"
+    assert agent.calls == [('exa', ('rare term',)), ('exa', ('rare term',))]
+
+
+def test_partial_results_are_cached_with_warning(agent, monkeypatch):
+    article = {'title': 'Partial', 'url': 'https://example.com/partial', 'content': ''}
+
+    def exa(keywords, start_date, end_date, fallback_dt=None):
+        agent.calls.append(('exa', tuple(keywords)))
+        raise _SourceSearchError("1 of 2 Exa strategies failed: Exa API error: 503", [article], failed=False)
+
+    monkeypatch.setattr(agent, '_get_source_searchers', lambda: {'exa': exa})
+    start_date, end_date = _date_range()
+    _, articles, warning, failed = agent._search_source('exa', ['rare term'], start_date, end_date)
+    _, cached_articles, cached_warning, _ = agent._search_source('exa', ['rare term'], start_date, end_date)
+
+    assert articles == cached_articles == [article]
+    assert warning.startswith("1 of 2") and not failed
+    assert cached_warning is None
+    assert len(agent.calls) == 1
+
+
+def test_rejected_request_is_retried_with_expanded_terms(agent, monkeypatch):
+    def exa(keywords, start_date, end_date, fallback_dt=None):
+        agent.calls.append(('exa', tuple(keywords)))
+        raise _SourceSearchError("Exa API error: 400", failed=False)
+
+    monkeypatch.setattr(agent, '_get_source_searchers', lambda: {'exa': exa})
+    start_date, end_date = _date_range()
+    raw_data = agent._collect_multi_source_data(['rare term'], start_date, end_date, ['exa'])
+
+    assert [source for source, _ in agent.calls] == ['exa', 'exa']
+    assert raw_data['fallback']
+
+
+@pytest.mark.parametrize('statuses, failed', [((503, 503), True), ((400, 400), False), ((400, 429), True)])
+def test_all_strategies_failing_marks_outages_only(agent, statuses, failed):
+    strategies = {f'strategy_{i}': {'status': status} for i, status in enumerate(statuses)}
+
+    def execute_query(config, start_date, end_date, max_results, strategy_name, fallback_dt=None):
+        raise _SourceSearchError(f"Exa API error: {config['status']}",
+                                 failed=pharma_agent._is_outage_status(config['status']))
+
+    start_date, end_date = _date_range()
+    with pytest.raises(_SourceSearchError) as excinfo:
+        agent._run_query_strategies(strategies, execute_query, start_date, end_date, 10)
+    assert excinfo.value.failed is failed